@@ -4,6 +4,7 @@ from ._fast_engset import (
     Algorithm,
     Status,
     blocking_prob,
+    blocking_prob_batch,
     n_servers,
     n_sources,
     total_traffic,
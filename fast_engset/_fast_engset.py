@@ -1,7 +1,8 @@
 """_fast_engset.py"""
 
-from typing import Any, NamedTuple, Union
+from typing import Any, NamedTuple, Optional, Tuple, Union
 from enum import Enum
+import functools
 import logging
 import math
 import os
@@ -16,26 +17,70 @@ _TOTAL_TRAFFIC_WARNING = (
     "source is generally assumed to offer at most one Erlang of traffic)"
 )
 
+# Largest polynomial degree evaluated in full (see ``_hyp2f1_from_coefs``)
+_HORNER_MAX_DEGREE = 128
+
+# Smallest polynomial degree evaluated by Estrin's scheme instead of Horner's method (see ``_hyp2f1_from_coefs``), below
+# which the shorter dependency chain does not make up for the extra multiplications
+_ESTRIN_MIN_DEGREE = 24
+
+# Smallest tolerance for which polynomial coefficients are stored in single precision by default (see ``_coefs_dtype``)
+_FLOAT32_COEFS_MIN_TOL = pow(2, -20)
+
+# Fast math flags used by compiled kernels (which are cached on disk and reused by later processes). These exclude
+# flags that change the handling of infinities and NaNs, both of which the solvers rely on.
+_FASTMATH = {"arcp", "contract", "nsz", "reassoc"}
+
+# Whether to skip argument validation even when it is requested (see ``_validate_args``)
+_SKIP_VALIDATION = "FAST_ENGSET_SKIP_VALIDATION" in os.environ
+
 
 def _maybe_jit(func):
     return func
 
 
-logger = logging.getLogger("fast-engset")
-stream_handler = logging.StreamHandler()
-stream_handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter("%(asctime)s %(name)s: [%(levelname)s] %(message)s")
-stream_handler.setFormatter(formatter)
-logger.addHandler(stream_handler)
+_maybe_jit_parallel = _maybe_jit
+_prange: Any = range
+_jit_enabled = False
+
+
+def _multiply_add(a: float, b: float, c: float) -> float:
+    """Computes ``a * b + c``, which overflows to infinity (as the solvers expect) unlike ``math.fma``."""
+    return a * b + c
+
+
+# Multiply-add used by the polynomial evaluators (fused with a single rounding in compiled kernels; see below)
+_fma: Any = _multiply_add
+
+# Output is left to the application (see the "Enabling logging" section of the README)
+_logger = logging.getLogger("fast-engset")
+_logger.addHandler(logging.NullHandler())
 
 
 if "FAST_ENGSET_NO_JIT" not in os.environ:
     try:
-        from numba import jit  # type: ignore
+        from numba import jit, prange, types  # type: ignore
+        from numba.extending import intrinsic  # type: ignore
+
+        @intrinsic
+        def _fma_intrinsic(typingctx, a, b, c):  # pylint: disable=unused-argument
+            """Emits ``llvm.fma.f64`` so that compiled kernels use a fused multiply-add regardless of fast math."""
+            sig = types.float64(types.float64, types.float64, types.float64)
+
+            def codegen(context, builder, signature, args):  # pylint: disable=unused-argument
+                return builder.fma(*args)
 
-        _maybe_jit = jit(nopython=True)
+            return sig, codegen
+
+        _maybe_jit = jit(nopython=True, cache=True, fastmath=_FASTMATH, boundscheck=False, error_model="numpy")
+        _maybe_jit_parallel = jit(
+            nopython=True, cache=True, fastmath=_FASTMATH, boundscheck=False, error_model="numpy", parallel=True
+        )
+        _prange = prange
+        _fma = _fma_intrinsic
+        _jit_enabled = True
     except ImportError:
-        logging.getLogger("fast-engset").warning("Unable to JIT due to missing Numba")
+        _logger.warning("Unable to JIT due to missing Numba")
 
 
 class Status(Enum):
@@ -55,12 +100,28 @@ class _Result(NamedTuple):
     value: Union[float, int]
 
 
+class _BatchResult(NamedTuple):
+    """Batched computation result."""
+
+    n_iters: NDArray[np.int64]
+    status: NDArray[np.int64]
+    value: NDArray[np.float64]
+
+
+def _make_result(raw: Tuple[int, int, Union[float, int]]) -> _Result:
+    """Wraps the plain ``(n_iters, status, value)`` tuple returned by a compiled solver (see ``Status``)."""
+    n_iters, status, value = raw
+    return _Result(n_iters=n_iters, status=Status(status), value=value)
+
+
 class Algorithm(Enum):
     """Algorithm to use for computing blocking probability."""
 
     BISECT = 0
     FIXEDP = 1
     NEWTON = 2
+    BIT_BISECT = 3
+    ANDERSON_BJORCK = 4
 
 
 def blocking_prob(
@@ -71,6 +132,7 @@ def blocking_prob(
     max_n_iters: int = 1024,
     tol: float = pow(2, -24),
     check: bool = True,
+    use_float32_coefs: Optional[bool] = None,
     **kwargs: Any,
 ) -> _Result:
     """Blocking probability in the Engset model.
@@ -85,14 +147,20 @@ def blocking_prob(
         Total offered traffic from all sources in Erlangs. Satisfies ``total_traffic = n_sources * per_source_traffic``
         where ``per_source_traffic`` is the offered traffic per-source.
     alg
-        One of ``Algorithm.BISECT``, ``Algorithm.FIXEDP``, ``Algorithm.NEWTON``. The fixed point algorithm can be
-        unstable; use at your own risk.
+        One of ``Algorithm.BISECT``, ``Algorithm.BIT_BISECT``, ``Algorithm.FIXEDP``, ``Algorithm.NEWTON``. The fixed
+        point algorithm can be unstable; use at your own risk.
     max_n_iters
         Maximum number of iterations.
     tol
         Error tolerance.
     check
         Whether to validate arguments.
+    use_float32_coefs
+        Whether to store polynomial coefficients in single precision (while still accumulating in double
+        precision), which halves their memory footprint at the cost of rounding each coefficient to about seven
+        significant digits. Coefficients that would overflow or underflow (i.e., lose precision or vanish) in single
+        precision are kept in double precision. By default, single precision is used only if ``tol >= 2 ** -20``
+        and ``n_servers > 128``.
     initial_guess
         Initial guess (suported only by ``Algorithm.FIXEDP`` and ``Algorithm.NEWTON``).
 
@@ -115,19 +183,113 @@ def blocking_prob(
     n_servers = int(n_servers)
     n_sources = int(n_sources)
 
+    dtype = _coefs_dtype(use_float32_coefs, n_servers, tol)
+    if alg == Algorithm.NEWTON:
+        coefs = _hyp2f1_coefs_and_deriv_cached(n_servers, n_sources, dtype)
+        return _make_result(
+            _blocking_prob_newton(coefs, n_servers, n_sources, total_traffic, max_n_iters, tol, **kwargs)
+        )
+    coefs = _hyp2f1_coefs_cached(n_servers, n_sources, dtype)
     if alg == Algorithm.BISECT:
-        func = _blocking_prob_bisect
-    elif alg == Algorithm.FIXEDP:
-        logging.getLogger("fast-engset").warning(
-            "The fixed point method for the blocking probability can be unstable; use at your own risk"
+        return _make_result(
+            _blocking_prob_bisect(coefs, n_servers, n_sources, total_traffic, max_n_iters, tol, **kwargs)
         )
-        func = _blocking_prob_fixed_point
-    elif alg == Algorithm.NEWTON:
-        func = _blocking_prob_newton
+    if alg == Algorithm.BIT_BISECT:
+        return _make_result(
+            _blocking_prob_bit_bisect(coefs, n_servers, n_sources, total_traffic, max_n_iters, tol, **kwargs)
+        )
+    if alg == Algorithm.FIXEDP:
+        _logger.warning("The fixed point method for the blocking probability can be unstable; use at your own risk")
+        return _make_result(
+            _blocking_prob_fixed_point(coefs, n_servers, n_sources, total_traffic, max_n_iters, tol, **kwargs)
+        )
+    raise ValueError("Unsupported algorithm")
+
+
+def blocking_prob_batch(
+    n_servers: int,
+    n_sources: int,
+    total_traffic: NDArray[np.float64],
+    alg: Algorithm = Algorithm.NEWTON,
+    max_n_iters: int = 1024,
+    tol: float = pow(2, -24),
+    check: bool = True,
+    use_float32_coefs: Optional[bool] = None,
+    **kwargs: Any,
+) -> _BatchResult:
+    """Blocking probabilities in the Engset model for an array of total traffics.
+
+    Equivalent to calling ``blocking_prob`` on each entry of ``total_traffic``, but the entries are processed in
+    parallel (when JIT compilation is enabled) without returning to Python in between.
+
+    Parameters
+    ----------
+    n_servers
+        Number of servers.
+    n_sources
+        Number of sources.
+    total_traffic
+        Array of total offered traffics from all sources in Erlangs.
+    alg
+        Accepts only ``Algorithm.BISECT`` or ``Algorithm.NEWTON``.
+    max_n_iters
+        Maximum number of iterations.
+    tol
+        Error tolerance.
+    check
+        Whether to validate arguments.
+    use_float32_coefs
+        Whether to store polynomial coefficients in single precision (while still accumulating in double
+        precision), which halves their memory footprint at the cost of rounding each coefficient to about seven
+        significant digits. Coefficients that would overflow or underflow (i.e., lose precision or vanish) in single
+        precision are kept in double precision. By default, single precision is used only if ``tol >= 2 ** -20``
+        and ``n_servers > 128``.
+    initial_guess
+        Initial guess (supported only by ``Algorithm.NEWTON`` and shared by all entries).
+
+    Returns
+    -------
+    n_iters
+        Array of numbers of iterations required to converge.
+    status
+        Array of status codes (i.e., the values of the ``Status`` enumeration).
+    value
+        Array of results of the computation.
+    """
+    total_traffic = np.asarray(total_traffic, dtype=np.float64)
+    if check:
+        _validate_batch_args(
+            n_servers_=n_servers,
+            n_sources_=n_sources,
+            total_traffic_=total_traffic,
+        )
+    n_servers = int(n_servers)
+    n_sources = int(n_sources)
+
+    flat_total_traffic = np.ascontiguousarray(total_traffic.reshape(-1))
+    n_iters = np.empty(flat_total_traffic.shape, dtype=np.int64)
+    status = np.empty(flat_total_traffic.shape, dtype=np.int64)
+    value = np.empty(flat_total_traffic.shape, dtype=np.float64)
+
+    dtype = _coefs_dtype(use_float32_coefs, n_servers, tol)
+    if alg == Algorithm.NEWTON:
+        coefs = _hyp2f1_coefs_and_deriv_cached(n_servers, n_sources, dtype)
+        _blocking_prob_newton_batch(
+            coefs, n_servers, n_sources, flat_total_traffic, max_n_iters, tol, n_iters, status, value, **kwargs
+        )
+    elif alg == Algorithm.BISECT:
+        coefs = _hyp2f1_coefs_cached(n_servers, n_sources, dtype)
+        # Without JIT compilation, NumPy operations over the whole batch beat a loop over the scalar solver
+        func = _blocking_prob_bisect_batch if _jit_enabled else _blocking_prob_bisect_vectorized
+        func(coefs, n_servers, n_sources, flat_total_traffic, max_n_iters, tol, n_iters, status, value, **kwargs)
     else:
         raise ValueError("Unsupported algorithm")
 
-    return func(n_servers, n_sources, total_traffic, max_n_iters, tol, **kwargs)
+    return _BatchResult(
+        n_iters=n_iters.reshape(total_traffic.shape),
+        status=status.reshape(total_traffic.shape),
+        value=value.reshape(total_traffic.shape),
+    )
 
 
 def n_servers(
@@ -183,7 +345,7 @@ def n_servers(
     else:
         raise ValueError("Unsupported algorithm")
 
-    return func(blocking_prob, n_sources, total_traffic, max_n_iters, tol, **kwargs)
+    return _make_result(func(blocking_prob, n_sources, total_traffic, max_n_iters, tol, **kwargs))
 
 
 def n_sources(
@@ -245,7 +407,7 @@ def n_sources(
     else:
         raise ValueError("Unsupported algorithm")
 
-    return func(blocking_prob, n_servers, total_traffic, max_n_iters, tol, **kwargs)
+    return _make_result(func(blocking_prob, n_servers, total_traffic, max_n_iters, tol, **kwargs))
 
 
 def total_traffic(
@@ -256,13 +418,14 @@ def total_traffic(
     max_n_iters: int = 1024,
     tol: float = pow(2, -24),
     check: bool = True,
+    use_float32_coefs: Optional[bool] = None,
     **kwargs: Any,
 ) -> _Result:
     """Total offered traffic in the Engset model.
 
     Note that for sufficiently large blocking probabilities are only achievable with a total traffic greater than the
-    number of servers. Depending on your application, this may not be physically meaningful. `fe.total_traffic` issues
-    a warning in this case:
+    number of servers. Depending on your application, this may not be physically meaningful. `fe.total_traffic` logs a
+    warning to the ``fast-engset`` logger in this case.
 
     Parameters
     ----------
@@ -273,13 +436,21 @@ def total_traffic(
     n_sources
         Number of sources.
     alg
-        One of ``Algorithm.BISECT``, ``Algorithm.NEWTON``. The Newton's method can be unstable; use at your own risk.
+        One of ``Algorithm.ANDERSON_BJORCK``, ``Algorithm.BISECT``, ``Algorithm.NEWTON``. The Anderson-Bjorck method
+        (a variant of the method of false position) typically converges in far fewer iterations than bisection. The
+        Newton's method can be unstable; use at your own risk.
     max_n_iters
         Maximum number of iterations.
     tol
         Error tolerance.
     check
         Whether to validate arguments.
+    use_float32_coefs
+        Whether to store polynomial coefficients in single precision (while still accumulating in double
+        precision), which halves their memory footprint at the cost of rounding each coefficient to about seven
+        significant digits. Coefficients that would overflow or underflow (i.e., lose precision or vanish) in single
+        precision are kept in double precision. By default, single precision is used only if ``tol >= 2 ** -20``
+        and ``n_servers > 128``.
     initial_guess
         Initial guess (suported only by ``Algorithm.NEWTON``).
 
@@ -302,43 +473,148 @@ def total_traffic(
     n_servers = int(n_servers)
     n_sources = int(n_sources)
 
+    dtype = _coefs_dtype(use_float32_coefs, n_servers, tol)
     if alg == Algorithm.BISECT:
-        func = _total_traffic_bisect
+        coefs = _hyp2f1_coefs_cached(n_servers, n_sources, dtype)
+        raw = _total_traffic_bisect(coefs, blocking_prob, n_servers, n_sources, max_n_iters, tol, **kwargs)
+    elif alg == Algorithm.ANDERSON_BJORCK:
+        coefs = _hyp2f1_coefs_cached(n_servers, n_sources, dtype)
+        raw = _total_traffic_anderson_bjorck(coefs, blocking_prob, n_servers, n_sources, max_n_iters, tol, **kwargs)
     elif alg == Algorithm.NEWTON:
-        logging.getLogger("fast-engset").warning(
-            "Newton's method for the total traffic can be unstable; use at your own risk"
-        )
-        func = _total_traffic_newton
+        _logger.warning("Newton's method for the total traffic can be unstable; use at your own risk")
+        coefs = _hyp2f1_coefs_and_deriv_cached(n_servers, n_sources, dtype)
+        raw = _total_traffic_newton(coefs, blocking_prob, n_servers, n_sources, max_n_iters, tol, **kwargs)
     else:
         raise ValueError("Unsupported algorithm")
 
-    result = func(blocking_prob, n_servers, n_sources, max_n_iters, tol, **kwargs)
+    result = _make_result(raw)
     if result.status == Status.OK and result.value > n_sources:
-        logging.getLogger("fast-engset").warning(_TOTAL_TRAFFIC_WARNING)
+        _logger.warning(_TOTAL_TRAFFIC_WARNING)
     return result
 
 
+def _coefs_dtype(
+    use_float32_coefs: Optional[bool],
+    n_servers_: int,
+    tol: float,
+) -> type:
+    """Data type in which to store polynomial coefficients (see ``use_float32_coefs`` in ``blocking_prob``).
+
+    By default, single precision is only used when it is accurate enough for ``tol`` and the polynomial is long enough
+    for the memory traffic of its coefficients to matter. For shorter polynomials, converting each coefficient to
+    double precision costs more than it saves. Whether the coefficients are faithfully represented in single precision
+    (i.e., neither overflow nor underflow) is only known once they are computed, so that is checked by the cached
+    builders instead (see ``_coefs_astype``).
+    """
+    if use_float32_coefs is None:
+        use_float32_coefs = tol >= _FLOAT32_COEFS_MIN_TOL and n_servers_ > _HORNER_MAX_DEGREE
+    return np.float32 if use_float32_coefs else np.float64
+
+
+@_maybe_jit
+def _bit_midpoint(
+    lo: float,
+    hi: float,
+    buf: NDArray[np.float64],
+) -> float:
+    """Midpoint of two nonnegative floats taken over their IEEE-754 bit patterns (``buf`` is scratch of length 2).
+
+    Bisecting with this midpoint shrinks any bracket down to adjacent floats in at most 64 iterations, regardless of
+    the magnitude of its endpoints. The midpoint coincides with ``lo`` once the endpoints are adjacent.
+    """
+    buf[0] = lo
+    buf[1] = hi
+    bits = buf.view(np.int64)
+    bits[0] += (bits[1] - bits[0]) // 2
+    return float(buf[0])
+
+
 @_maybe_jit
 def _hyp2f1_coefs(
     param1: int,
     param2: int,
 ) -> NDArray[np.float64]:
     """Coefficients of ``f(z) = hyp2f1(1, -param1, param2 - param1, z)``."""
+    coefs = np.empty((param1 + 1,))
+    coefs[0] = 1.0
     f = param1
     g = param2 - param1
-    coefs = np.zeros((param1 + 1,))
-    coefs[0] = 1.0
-    k = 1
-    while True:
+    for k in range(1, param1 + 1):
         coefs[k] = f / g * coefs[k - 1]
         f -= 1
-        if f == 0:
-            break
-        k += 1
         g += 1
     return coefs
 
 
+def _coefs_astype(
+    coefs: NDArray[np.float64],
+    dtype: type,
+) -> NDArray[np.floating]:
+    """Converts coefficients to ``dtype``, or returns them unchanged if they would overflow or underflow it.
+
+    Coefficients below the smallest normal number of ``dtype`` would be stored with reduced precision or flushed to
+    zero, yet they can still dominate the polynomial once multiplied by a large power of its argument.
+    """
+    finfo = np.finfo(dtype)
+    magnitudes = np.abs(coefs)
+    overflows = magnitudes.max() >= finfo.max  # pylint: disable=no-member
+    underflows = np.any((magnitudes != 0.0) & (magnitudes < finfo.tiny))
+    if overflows or underflows:
+        return coefs
+    return coefs.astype(dtype, copy=False)
+
+
+@functools.lru_cache(maxsize=256)
+def _hyp2f1_coefs_cached(
+    param1: int,
+    param2: int,
+    dtype: type = np.float64,
+) -> NDArray[np.floating]:
+    """Memoized, read-only version of ``_hyp2f1_coefs`` for repeated solves with the same parameters.
+
+    The coefficients are always computed in double precision before being converted to ``dtype`` (see
+    ``_coefs_astype``).
+    """
+    coefs = _coefs_astype(_hyp2f1_coefs(param1, param2), dtype)
+    coefs.setflags(write=False)
+    return coefs
+
+
+@_maybe_jit
+def _hyp2f1_coefs_and_deriv(
+    param1: int,
+    param2: int,
+) -> NDArray[np.float64]:
+    """Interleaves the output of ``_hyp2f1_coefs`` with the coefficients of its derivative.
+
+    Row ``k`` of the ``(param1 + 1, 2)`` output holds the ``k``-th coefficient and that coefficient times ``k``, so
+    that methods needing both the polynomial and its derivative read them from the same cache line.
+    """
+    coefs = np.empty((param1 + 1, 2))
+    coefs[0, 0] = 1.0
+    coefs[0, 1] = 0.0
+    f = param1
+    g = param2 - param1
+    for k in range(1, param1 + 1):
+        coefs[k, 0] = f / g * coefs[k - 1, 0]
+        coefs[k, 1] = k * coefs[k, 0]
+        f -= 1
+        g += 1
+    return coefs
+
+
+@functools.lru_cache(maxsize=256)
+def _hyp2f1_coefs_and_deriv_cached(
+    param1: int,
+    param2: int,
+    dtype: type = np.float64,
+) -> NDArray[np.floating]:
+    """Memoized, read-only version of ``_hyp2f1_coefs_and_deriv`` (see ``_hyp2f1_coefs_cached``)."""
+    coefs = _coefs_astype(_hyp2f1_coefs_and_deriv(param1, param2), dtype)
+    coefs.setflags(write=False)
+    return coefs
+
+
 @_maybe_jit
 def _hyp2f1_from_coefs(
     coefs: NDArray[np.float64],
@@ -346,18 +622,159 @@ def _hyp2f1_from_coefs(
     arg: float,
     tol: float,
 ) -> float:
-    """Computes ``hyp2f1(1, -param1, param2 - param1, -arg)`` using the output from ``_hyp2f1_coefs``."""
-    h1 = 1.0
-    mlt = arg
+    """Computes ``hyp2f1(1, -param1, param2 - param1, -arg)`` using the output from ``_hyp2f1_coefs``.
+
+    Polynomials of degree at most ``_HORNER_MAX_DEGREE`` are evaluated in full (see ``_hyp2f1_horner_full`` and
+    ``_hyp2f1_estrin_full``), which is cheaper than testing for convergence after each term. Larger degrees are
+    truncated once the terms become negligible (see ``_hyp2f1_truncated``).
+    """
+    if param1 < _ESTRIN_MIN_DEGREE:
+        return _hyp2f1_horner_full(coefs, param1, arg)
+    if param1 <= _HORNER_MAX_DEGREE:
+        return _hyp2f1_estrin_full(coefs, param1, arg)
+    return _hyp2f1_truncated(coefs, param1, arg, tol)
+
+
+@_maybe_jit
+def _hyp2f1_horner_full(
+    coefs: NDArray[np.float64],
+    param1: int,
+    arg: float,
+) -> float:
+    """Evaluates the degree ``param1`` polynomial with coefficients ``coefs`` at ``arg`` by Horner's method.
+
+    The sum is accumulated in double precision even if ``coefs`` is single precision.
+    """
+    h1 = np.float64(coefs[param1])
+    for k in range(param1 - 1, -1, -1):
+        h1 = _fma(h1, arg, coefs[k])
+    return h1
+
+
+@_maybe_jit
+def _hyp2f1_estrin_full(
+    coefs: NDArray[np.float64],
+    param1: int,
+    arg: float,
+) -> float:
+    """Computes ``_hyp2f1_horner_full`` by Estrin's scheme.
+
+    Consecutive pairs of terms are combined as ``coefs[k] + coefs[k + 1] * arg`` and the pairs are then evaluated by
+    Horner's method in ``arg * arg``. The pairs do not depend on each other, which halves the length of the chain of
+    dependent operations.
+    """
+    arg2 = arg * arg
+    if param1 % 2 == 0:
+        h1 = np.float64(coefs[param1])
+        k = param1 - 2
+    else:
+        h1 = _fma(np.float64(coefs[param1]), arg, coefs[param1 - 1])
+        k = param1 - 3
+    while k >= 0:
+        h1 = _fma(h1, arg2, _fma(np.float64(coefs[k + 1]), arg, coefs[k]))
+        k -= 2
+    return h1
+
+
+@_maybe_jit
+def _hyp2f1_truncated(
+    coefs: NDArray[np.float64],
+    param1: int,
+    arg: float,
+    tol: float,
+) -> float:
+    """Accumulates the terms of ``_hyp2f1_horner_full`` in increasing order, stopping once they become negligible.
+
+    Odd and even terms are accumulated separately (two at a time) to break the dependency between consecutive terms.
+    """
+    arg2 = arg * arg
+    h1_even = np.float64(coefs[0])
+    h1_odd = np.float64(0.0)
+    mlt_odd = arg
+    mlt_even = arg2
+    k = 1
+    while True:
+        u_odd = coefs[k] * mlt_odd
+        h1_odd += u_odd
+        if k == param1:
+            break
+        u_even = coefs[k + 1] * mlt_even
+        h1_even += u_even
+        if k + 1 == param1 or abs(u_odd + u_even) <= tol * abs(h1_even + h1_odd):
+            break
+        k += 2
+        mlt_odd *= arg2
+        mlt_even *= arg2
+    return h1_even + h1_odd
+
+
+@_maybe_jit
+def _hyp2f1_and_deriv_from_coefs(
+    coefs: NDArray[np.float64],
+    param1: int,
+    arg: float,
+    tol: float,
+) -> Tuple[float, float]:
+    """Computes ``_hyp2f1_from_coefs`` and its derivative with respect to ``arg`` in a single pass.
+
+    Here, ``coefs`` is the output from ``_hyp2f1_coefs_and_deriv``. When the sum is truncated early, both sums are
+    truncated at the same term.
+    """
+    if param1 <= _HORNER_MAX_DEGREE:
+        h1 = np.float64(coefs[param1, 0])
+        dh1 = np.float64(coefs[param1, 1])
+        for k in range(param1 - 1, 0, -1):
+            h1 = _fma(h1, arg, coefs[k, 0])
+            dh1 = _fma(dh1, arg, coefs[k, 1])
+        return _fma(h1, arg, coefs[0, 0]), dh1
+    h1 = np.float64(coefs[0, 0])
+    dh1 = np.float64(0.0)
+    mlt = 1.0
     k = 1
     while True:
-        u = coefs[k] * mlt
+        dh1 += coefs[k, 1] * mlt
+        mlt *= arg
+        u = coefs[k, 0] * mlt
         h1 += u
-        if k == param1 or abs(u / h1) <= tol:
+        if k == param1 or abs(u) <= tol * abs(h1):
             break
         k += 1
-        mlt *= arg
-    return h1
+    return h1, dh1
+
+
+def _hyp2f1_from_coefs_vectorized(
+    coefs: NDArray[np.floating],
+    param1: int,
+    args: NDArray[np.float64],
+    tol: float,
+    out: NDArray[np.float64],
+) -> None:
+    """Computes ``_hyp2f1_from_coefs`` at each of ``args`` using NumPy operations, storing the results in ``out``.
+
+    Each step is applied to all of ``args`` at once (in place), so that the interpreter overhead is paid once per
+    coefficient instead of once per coefficient and argument. Sums of degree larger than ``_HORNER_MAX_DEGREE`` are
+    truncated once their terms become negligible for all of ``args``.
+    """
+    if param1 > _HORNER_MAX_DEGREE:
+        # Terms grow until ``abs(arg) * coefs[k] / coefs[k - 1]`` drops below one, so the sum cannot be truncated
+        # before then. If that happens late, the full sum (by Horner's method) is cheaper.
+        decreasing = np.max(np.abs(args)) * coefs[1 : param1 + 1] < coefs[:param1]
+        if np.any(decreasing) and 2 * np.argmax(decreasing) <= param1:
+            out[:] = coefs[0]
+            mlt = args.copy()
+            u = np.empty_like(args)
+            for k in range(1, param1 + 1):
+                np.multiply(mlt, coefs[k], out=u)
+                np.add(out, u, out=out)
+                # Testing for convergence costs more than accumulating a term, so only test every few terms
+                if k % 8 == 0 and np.all(np.abs(u) <= tol * np.abs(out)):
+                    break
+                np.multiply(mlt, args, out=mlt)
+            return
+    out[:] = coefs[param1]
+    for k in range(param1 - 1, -1, -1):
+        np.multiply(out, args, out=out)
+        np.add(out, coefs[k], out=out)
 
 
 @_maybe_jit
@@ -367,74 +784,235 @@ def _hyp2f1(
     arg: float,
     tol: float,
 ) -> float:
-    coefs = _hyp2f1_coefs(param1, param2)
-    return _hyp2f1_from_coefs(coefs, param1, arg, tol)
+    """Computes ``hyp2f1(1, -param1, param2 - param1, -arg)`` without materializing ``_hyp2f1_coefs``.
+
+    Each coefficient is generated from the previous one as the sum is accumulated, which is cheaper than building the
+    coefficient array when it is only used once. As in ``_hyp2f1_from_coefs``, the sum is only truncated early for
+    degrees larger than ``_HORNER_MAX_DEGREE``.
+    """
+    truncate = param1 > _HORNER_MAX_DEGREE
+    f = param1
+    g = param2 - param1
+    u = 1.0
+    h1 = 1.0
+    while f > 0:
+        u *= f / g * arg
+        h1 += u
+        if truncate and abs(u) <= tol * abs(h1):
+            break
+        f -= 1
+        g += 1
+    return h1
 
 
 @_maybe_jit
 def _blocking_prob_newton(
+    coefs: NDArray[np.float64],
     n_servers_: int,
     n_sources_: int,
     total_traffic_: float,
     max_n_iters: int,
     tol: float,
     initial_guess: float = 0.5,
-) -> _Result:
-    coefs = _hyp2f1_coefs(n_servers_, n_sources_)
+) -> Tuple[int, int, float]:
     y = n_sources_ / total_traffic_ - 1.0
     blocking_prob_ = initial_guess
+    # Safeguard Newton's method by maintaining a bracket around the root and bisecting whenever a step would leave the
+    # bracket or fails to shrink fast enough (see ``rtsafe`` in Numerical Recipes)
+    lo = 0.0
+    hi = 1.0
+    step_old = hi - lo
+    step = step_old
     for n_iters in range(1, max_n_iters + 1):
         x = blocking_prob_ + y
-        f = 1.0 / _hyp2f1_from_coefs(coefs, n_servers_, x, tol)
-        g = 1.0 / _hyp2f1_from_coefs(coefs, n_servers_, x + tol, tol)
-        blocking_prob_new = blocking_prob_ + (f - blocking_prob_) / ((f - g) / tol + 1.0)
+        h1, dh1 = _hyp2f1_and_deriv_from_coefs(coefs, n_servers_, x, tol)
+        if h1 == math.inf:
+            # The blocking probability underflows to zero (and the derivative below would be zero times infinity)
+            f = 0.0
+            df = 0.0
+        else:
+            f = 1.0 / h1
+            df = f * f * dh1  # Minus the derivative of f
+        if f > blocking_prob_:
+            lo = blocking_prob_
+        else:
+            hi = blocking_prob_
+        step_new = (f - blocking_prob_) / (df + 1.0)
+        blocking_prob_new = blocking_prob_ + step_new
+        # Written so that a step that is not finite (for which every comparison is false) also falls back to bisection
+        if not (lo <= blocking_prob_new <= hi) or abs(2.0 * step_new) > abs(step_old):
+            blocking_prob_new = (lo + hi) / 2.0
+            step_new = blocking_prob_new - blocking_prob_
+        step_old = step
+        step = step_new
         if abs(blocking_prob_ - blocking_prob_new) <= tol:
-            return _Result(n_iters=n_iters, status=Status.OK, value=blocking_prob_new)
+            return n_iters, Status.OK.value, blocking_prob_new
         blocking_prob_ = blocking_prob_new
-    return _Result(n_iters=max_n_iters, status=Status.MAX_N_ITERS_REACHED, value=blocking_prob_)
+    return max_n_iters, Status.MAX_N_ITERS_REACHED.value, blocking_prob_
+
+
+@_maybe_jit_parallel
+def _blocking_prob_newton_batch(
+    coefs: NDArray[np.float64],
+    n_servers_: int,
+    n_sources_: int,
+    total_traffic_: NDArray[np.float64],
+    max_n_iters: int,
+    tol: float,
+    n_iters: NDArray[np.int64],
+    status: NDArray[np.int64],
+    value: NDArray[np.float64],
+    initial_guess: float = 0.5,
+) -> None:
+    for i in _prange(total_traffic_.size):  # pylint: disable=not-an-iterable
+        n_iters[i], status[i], value[i] = _blocking_prob_newton(
+            coefs, n_servers_, n_sources_, total_traffic_[i], max_n_iters, tol, initial_guess
+        )
 
 
 @_maybe_jit
 def _blocking_prob_bisect(
+    coefs: NDArray[np.float64],
     n_servers_: int,
     n_sources_: int,
     total_traffic_: float,
     max_n_iters: int,
     tol: float,
-) -> _Result:
-    coefs = _hyp2f1_coefs(n_servers_, n_sources_)
+) -> Tuple[int, int, float]:
     y = n_sources_ / total_traffic_ - 1.0
     lo = 0.0
     hi = 1.0
     for n_iters in range(1, max_n_iters + 1):
         blocking_prob_ = (lo + hi) / 2.0
         if (hi - lo) / 2.0 <= tol:
-            return _Result(n_iters=n_iters, status=Status.OK, value=blocking_prob_)
-        if 1.0 / _hyp2f1_from_coefs(coefs, n_servers_, blocking_prob_ + y, tol) < blocking_prob_:
+            return n_iters, Status.OK.value, blocking_prob_
+        if blocking_prob_ * _hyp2f1_from_coefs(coefs, n_servers_, blocking_prob_ + y, tol) > 1.0:
             hi = blocking_prob_
         else:
             lo = blocking_prob_
-    return _Result(n_iters=max_n_iters, status=Status.MAX_N_ITERS_REACHED, value=blocking_prob_)
+    return max_n_iters, Status.MAX_N_ITERS_REACHED.value, blocking_prob_
+
+
+@_maybe_jit_parallel
+def _blocking_prob_bisect_batch(
+    coefs: NDArray[np.float64],
+    n_servers_: int,
+    n_sources_: int,
+    total_traffic_: NDArray[np.float64],
+    max_n_iters: int,
+    tol: float,
+    n_iters: NDArray[np.int64],
+    status: NDArray[np.int64],
+    value: NDArray[np.float64],
+) -> None:
+    for i in _prange(total_traffic_.size):  # pylint: disable=not-an-iterable
+        n_iters[i], status[i], value[i] = _blocking_prob_bisect(
+            coefs, n_servers_, n_sources_, total_traffic_[i], max_n_iters, tol
+        )
+
+
+def _blocking_prob_bisect_vectorized(
+    coefs: NDArray[np.floating],
+    n_servers_: int,
+    n_sources_: int,
+    total_traffic_: NDArray[np.float64],
+    max_n_iters: int,
+    tol: float,
+    n_iters: NDArray[np.int64],
+    status: NDArray[np.int64],
+    value: NDArray[np.float64],
+) -> None:
+    """Runs ``_blocking_prob_bisect`` on each of ``total_traffic_`` in lockstep using NumPy operations.
+
+    Since every bracket starts as ``[0, 1]`` and is halved at each iteration, all entries converge at the same
+    iteration.
+    """
+    y = n_sources_ / total_traffic_ - 1.0
+    lo = np.zeros_like(y)
+    hi = np.ones_like(y)
+    h1 = np.empty_like(y)
+    blocking_prob_ = (lo + hi) / 2.0
+    for n_iters_ in range(1, max_n_iters + 1):
+        blocking_prob_ = (lo + hi) / 2.0
+        if np.all((hi - lo) / 2.0 <= tol):
+            n_iters[:] = n_iters_
+            status[:] = Status.OK.value
+            value[:] = blocking_prob_
+            return
+        _hyp2f1_from_coefs_vectorized(coefs, n_servers_, blocking_prob_ + y, tol, h1)
+        above = blocking_prob_ * h1 > 1.0
+        hi = np.where(above, blocking_prob_, hi)
+        lo = np.where(above, lo, blocking_prob_)
+    n_iters[:] = max_n_iters
+    status[:] = Status.MAX_N_ITERS_REACHED.value
+    value[:] = blocking_prob_
+
+
+@_maybe_jit
+def _blocking_prob_bit_bisect(
+    coefs: NDArray[np.float64],
+    n_servers_: int,
+    n_sources_: int,
+    total_traffic_: float,
+    max_n_iters: int,
+    tol: float,
+) -> Tuple[int, int, float]:
+    """Bisection over the bit patterns of ``[0, 1]`` (see ``_bit_midpoint``) with a relative tolerance.
+
+    Unlike ``_blocking_prob_bisect``, this resolves arbitrarily small blocking probabilities in at most 64 iterations.
+    """
+    y = n_sources_ / total_traffic_ - 1.0
+    lo = 0.0
+    hi = 1.0
+    buf = np.empty((2,))
+    for n_iters in range(1, max_n_iters + 1):
+        blocking_prob_ = _bit_midpoint(lo, hi, buf)
+        if hi - lo <= tol * hi or blocking_prob_ == lo:
+            return n_iters, Status.OK.value, blocking_prob_
+        if blocking_prob_ * _hyp2f1_from_coefs(coefs, n_servers_, blocking_prob_ + y, tol) > 1.0:
+            hi = blocking_prob_
+        else:
+            lo = blocking_prob_
+    return max_n_iters, Status.MAX_N_ITERS_REACHED.value, blocking_prob_
 
 
 @_maybe_jit
 def _blocking_prob_fixed_point(
+    coefs: NDArray[np.float64],
     n_servers_: int,
     n_sources_: int,
     total_traffic_: float,
     max_n_iters: int,
     tol: float,
     initial_guess: float = 0.5,
-) -> _Result:
-    coefs = _hyp2f1_coefs(n_servers_, n_sources_)
+) -> Tuple[int, int, float]:
     y = n_sources_ / total_traffic_ - 1.0
     blocking_prob_ = initial_guess
     for n_iters in range(1, max_n_iters + 1):
         blocking_prob_new = 1.0 / _hyp2f1_from_coefs(coefs, n_servers_, blocking_prob_ + y, tol)
         if abs(blocking_prob_ - blocking_prob_new) <= tol:
-            return _Result(n_iters=n_iters, status=Status.OK, value=blocking_prob_new)
+            return n_iters, Status.OK.value, blocking_prob_new
         blocking_prob_ = blocking_prob_new
-    return _Result(n_iters=max_n_iters, status=Status.MAX_N_ITERS_REACHED, value=blocking_prob_)
+    return max_n_iters, Status.MAX_N_ITERS_REACHED.value, blocking_prob_
+
+
+@_maybe_jit
+def _erlang_b_n_servers(
+    blocking_prob_: float,
+    total_traffic_: float,
+    max_n_servers: int,
+) -> int:
+    """Fewest servers (at most ``max_n_servers``) whose Erlang B blocking probability is at most ``blocking_prob_``.
+
+    The Erlang B formula is the limit of the Engset formula as the number of sources grows. It is computed by the
+    recurrence ``B(k) = a * B(k - 1) / (k + a * B(k - 1))`` with ``B(0) = 1`` and ``a = total_traffic_``.
+    """
+    erlang_b = 1.0
+    for n_servers_ in range(1, max_n_servers + 1):
+        erlang_b = total_traffic_ * erlang_b / (n_servers_ + total_traffic_ * erlang_b)
+        if erlang_b <= blocking_prob_:
+            return n_servers_
+    return max_n_servers
 
 
 @_maybe_jit
@@ -444,19 +1022,35 @@ def _n_servers_bisect(
     total_traffic_: float,
     max_n_iters: int,
     tol: float,
-) -> _Result:
+) -> Tuple[int, int, int]:
     y = blocking_prob_ + n_sources_ / total_traffic_ - 1.0
     lo = 1
     hi = n_sources_
-    for n_iters in range(1, max_n_iters + 1):
+
+    # Bracket the solution by galloping down from the Erlang B solution, which tends to overestimate it (the Engset
+    # formula is only evaluated for fewer servers than sources)
+    n_servers_ = _erlang_b_n_servers(blocking_prob_, total_traffic_, n_sources_ - 1)
+    step = 1
+    n_pre_iters = 0
+    while lo < hi:
+        n_pre_iters += 1
+        if blocking_prob_ * _hyp2f1(n_servers_, n_sources_, y, tol) > 1.0:
+            hi = n_servers_
+            n_servers_ = max(lo, n_servers_ - step)
+            step *= 2
+        else:
+            lo = n_servers_ + 1
+            break
+
+    for n_iters in range(n_pre_iters + 1, max_n_iters + 1):
         if lo == hi:
-            return _Result(n_iters=n_iters, status=Status.OK, value=lo)
-        n_servers_ = (lo + hi) // 2
-        if 1.0 / _hyp2f1(n_servers_, n_sources_, y, tol) < blocking_prob_:
+            return n_iters, Status.OK.value, lo
+        n_servers_ = (lo + hi) >> 1
+        if blocking_prob_ * _hyp2f1(n_servers_, n_sources_, y, tol) > 1.0:
             hi = n_servers_
         else:
             lo = n_servers_ + 1
-    return _Result(n_iters=max_n_iters, status=Status.MAX_N_ITERS_REACHED, value=n_servers_)
+    return max_n_iters, Status.MAX_N_ITERS_REACHED.value, n_servers_
 
 
 @_maybe_jit
@@ -466,43 +1060,48 @@ def _n_sources_bisect(
     total_traffic_: float,
     max_n_iters: int,
     tol: float,
-) -> _Result:
+) -> Tuple[int, int, int]:
     y = blocking_prob_ - 1.0
     lo = n_servers_
     hi = lo * 2
 
     n_pre_iters = 0
-    prev = np.nan
+    prev = 0.0
+    has_prev = False
     while True:
         n_pre_iters += 1
-        value = 1.0 / _hyp2f1(n_servers_, hi, y + hi / total_traffic_, tol)
-        if value >= blocking_prob_:
+        value = _hyp2f1(n_servers_, hi, y + hi / total_traffic_, tol)
+        if blocking_prob_ * value <= 1.0:
             break
-        if abs(value - prev) <= abs(value) * tol:
-            return _Result(n_iters=n_pre_iters, status=Status.UNBOUNDED, value=sys.maxsize)
+        # Compare blocking probabilities instead of values of H, which can overflow (so that their difference is NaN)
+        value = 1.0 / value
+        if (has_prev and abs(value - prev) <= abs(value) * tol) or hi > sys.maxsize // 2:
+            return n_pre_iters, Status.UNBOUNDED.value, sys.maxsize
         prev = value
+        has_prev = True
         hi *= 2
 
+    n_sources_ = hi
     for n_iters in range(n_pre_iters + 1, max_n_iters + 1):
         if lo == hi:
-            return _Result(n_iters=n_iters, status=Status.OK, value=lo)
-        n_sources_ = math.ceil((lo + hi) / 2)
-        if 1.0 / _hyp2f1(n_servers_, n_sources_, y + n_sources_ / total_traffic_, tol) < blocking_prob_:
+            return n_iters, Status.OK.value, lo
+        n_sources_ = (lo + hi + 1) // 2
+        if blocking_prob_ * _hyp2f1(n_servers_, n_sources_, y + n_sources_ / total_traffic_, tol) > 1.0:
             lo = n_sources_
         else:
             hi = n_sources_ - 1
-    return _Result(n_iters=max_n_iters, status=Status.MAX_N_ITERS_REACHED, value=n_sources_)
+    return max_n_iters, Status.MAX_N_ITERS_REACHED.value, n_sources_
 
 
 @_maybe_jit
 def _total_traffic_bisect(
+    coefs: NDArray[np.float64],
     blocking_prob_: float,
     n_servers_: int,
     n_sources_: int,
     max_n_iters: int,
     tol: float,
-) -> _Result:
-    coefs = _hyp2f1_coefs(n_servers_, n_sources_)
+) -> Tuple[int, int, float]:
     y = blocking_prob_ - 1.0
     lo = 0.0
     hi = float(n_sources_)
@@ -510,45 +1109,112 @@ def _total_traffic_bisect(
     n_pre_iters = 0
     while True:
         n_pre_iters += 1
-        if 1.0 / _hyp2f1_from_coefs(coefs, n_servers_, y + n_sources_ / hi, tol) >= blocking_prob_:
+        if blocking_prob_ * _hyp2f1_from_coefs(coefs, n_servers_, y + n_sources_ / hi, tol) <= 1.0:
             break
+        lo = hi
         hi *= 2.0
 
+    # Halve the bracket until it has a positive lower endpoint (the midpoint of the bit patterns of zero and a typical
+    # total traffic is vanishingly small) and bisect over bit patterns after that
+    buf = np.empty((2,))
+    total_traffic_ = hi
     for n_iters in range(n_pre_iters + 1, max_n_iters + 1):
-        total_traffic_ = (lo + hi) / 2.0
-        if (hi - lo) / 2.0 <= tol:
-            return _Result(n_iters=n_iters, status=Status.OK, value=total_traffic_)
-        if 1.0 / _hyp2f1_from_coefs(coefs, n_servers_, y + n_sources_ / total_traffic_, tol) < blocking_prob_:
+        total_traffic_ = hi / 2.0 if lo == 0.0 else _bit_midpoint(lo, hi, buf)
+        if (hi - lo) / 2.0 <= tol or total_traffic_ == lo:
+            return n_iters, Status.OK.value, total_traffic_
+        if blocking_prob_ * _hyp2f1_from_coefs(coefs, n_servers_, y + n_sources_ / total_traffic_, tol) > 1.0:
             lo = total_traffic_
         else:
             hi = total_traffic_
-    return _Result(n_iters=max_n_iters, status=Status.MAX_N_ITERS_REACHED, value=total_traffic_)
+    return max_n_iters, Status.MAX_N_ITERS_REACHED.value, total_traffic_
+
+
+@_maybe_jit
+def _total_traffic_anderson_bjorck(
+    coefs: NDArray[np.float64],
+    blocking_prob_: float,
+    n_servers_: int,
+    n_sources_: int,
+    max_n_iters: int,
+    tol: float,
+) -> Tuple[int, int, float]:
+    y = blocking_prob_ - 1.0
+
+    # Find the root of f(s) = log(P * H) as a function of the log of the total traffic s, in which f is far closer to
+    # linear. The root is bracketed by [a, b] (in log space) with f(a) > 0 >= f(b).
+    b = float(n_sources_)
+    f_b = math.log(blocking_prob_ * _hyp2f1_from_coefs(coefs, n_servers_, y + 1.0, tol))
+    n_pre_iters = 1
+    if f_b > 0.0:
+        # The argument of H vanishes at the largest total traffic considered, so that H = 1 and f = log(P) there (past
+        # it, H can be negative)
+        a = b
+        f_a = f_b
+        b = n_sources_ / -y
+        f_b = math.log(blocking_prob_)
+    else:
+        while True:
+            n_pre_iters += 1
+            a = b / 2.0
+            f_a = math.log(blocking_prob_ * _hyp2f1_from_coefs(coefs, n_servers_, y + n_sources_ / a, tol))
+            if f_a > 0.0:
+                break
+            b = a
+            f_b = f_a
+    total_traffic_ = b
+    a = math.log(a)
+    b = math.log(b)
+
+    for n_iters in range(n_pre_iters + 1, max_n_iters + 1):
+        if f_b == 0.0:
+            return n_iters, Status.OK.value, total_traffic_
+        c = b - f_b * (b - a) / (f_b - f_a)
+        if not min(a, b) < c < max(a, b):
+            # Fall back to bisection if rounding puts the secant step outside of the bracket
+            c = 0.5 * (a + b)
+        total_traffic_new = math.exp(c)
+        f_c = math.log(blocking_prob_ * _hyp2f1_from_coefs(coefs, n_servers_, y + n_sources_ / total_traffic_new, tol))
+        if abs(total_traffic_new - total_traffic_) <= tol:
+            return n_iters, Status.OK.value, total_traffic_new
+        if f_c * f_b > 0.0:
+            # The endpoint a is retained, so its function value is scaled down to keep it from stagnating
+            m = 1.0 - f_c / f_b
+            f_a *= m if m > 0.0 else 0.5
+        else:
+            a = b
+            f_a = f_b
+        b = c
+        f_b = f_c
+        total_traffic_ = total_traffic_new
+    return max_n_iters, Status.MAX_N_ITERS_REACHED.value, total_traffic_
 
 
 @_maybe_jit
 def _total_traffic_newton(
+    coefs: NDArray[np.float64],
     blocking_prob_: float,
     n_servers_: int,
     n_sources_: int,
     max_n_iters: int,
     tol: float,
     initial_guess: float = 1.0,
-) -> _Result:
-    coefs = _hyp2f1_coefs(n_servers_, n_sources_)
+) -> Tuple[int, int, float]:
     y = blocking_prob_ - 1.0
     total_traffic_ = initial_guess
     for n_iters in range(1, max_n_iters + 1):
-        h = total_traffic_ * tol
-        f = 1.0 / _hyp2f1_from_coefs(coefs, n_servers_, y + n_sources_ / total_traffic_, tol)
-        g = 1.0 / _hyp2f1_from_coefs(coefs, n_servers_, y + n_sources_ / (total_traffic_ + h), tol)
-        dtotal_traffic = (f - g) / h
-        if dtotal_traffic == 0.0:
-            return _Result(n_iters=n_iters, status=Status.UNSTABLE, value=total_traffic_)
+        x = y + n_sources_ / total_traffic_
+        h1, dh1 = _hyp2f1_and_deriv_from_coefs(coefs, n_servers_, x, tol)
+        f = 1.0 / h1
+        # Minus the derivative of f with respect to the total traffic
+        dtotal_traffic = -f * f * dh1 * n_sources_
+        dtotal_traffic /= total_traffic_ * total_traffic_
+        if dtotal_traffic == 0.0 or not math.isfinite(dtotal_traffic):
+            return n_iters, Status.UNSTABLE.value, total_traffic_
         total_traffic_new = total_traffic_ + (f - blocking_prob_) / dtotal_traffic
         if abs(total_traffic_ - total_traffic_new) / abs(total_traffic_new) <= tol:
-            return _Result(n_iters=n_iters, status=Status.OK, value=total_traffic_new)
+            return n_iters, Status.OK.value, total_traffic_new
         total_traffic_ = total_traffic_new
-    return _Result(n_iters=max_n_iters, status=Status.MAX_N_ITERS_REACHED, value=total_traffic_)
+    return max_n_iters, Status.MAX_N_ITERS_REACHED.value, total_traffic_
 
 
 def _validate_args(
@@ -557,6 +1223,8 @@ def _validate_args(
     n_sources_: int,
     total_traffic_: float,
 ) -> None:
+    if _SKIP_VALIDATION:
+        return
     if blocking_prob_ <= 0.0 or blocking_prob_ >= 1.0:
         raise ValueError(f"Expected blocking_prob={blocking_prob_} to be strictly between 0 and 1")
     if n_servers_ <= 0 or n_servers_ % 1 != 0:
@@ -566,4 +1234,65 @@ def _validate_args(
     if total_traffic_ <= 0.0:
         raise ValueError(f"Expected total_traffic={total_traffic_} to be positive")
     if total_traffic_ > n_sources_:
-        logging.getLogger("fast-engset").warning(_TOTAL_TRAFFIC_WARNING)
+        _logger.warning(_TOTAL_TRAFFIC_WARNING)
+
+
+def _validate_batch_args(
+    n_servers_: int,
+    n_sources_: int,
+    total_traffic_: NDArray[np.float64],
+) -> None:
+    if _SKIP_VALIDATION:
+        return
+    _validate_args(
+        blocking_prob_=0.5,
+        n_servers_=n_servers_,
+        n_sources_=n_sources_,
+        total_traffic_=1.0,
+    )
+    if np.any(total_traffic_ <= 0.0):
+        raise ValueError("Expected total_traffic to be positive")
+    if np.any(total_traffic_ > n_sources_):
+        _logger.warning(_TOTAL_TRAFFIC_WARNING)
+
+
+def _warmup() -> None:
+    """Calls each kernel once so that it is compiled (or loaded from Numba's cache) ahead of its first real use."""
+    coefs = _hyp2f1_coefs_cached(1, 2)
+    coefs_and_deriv = _hyp2f1_coefs_and_deriv_cached(1, 2)
+    tol = pow(2, -24)
+    _blocking_prob_bisect(coefs, 1, 2, 1.0, 1, tol)
+    _blocking_prob_bit_bisect(coefs, 1, 2, 1.0, 1, tol)
+    _blocking_prob_fixed_point(coefs, 1, 2, 1.0, 1, tol)
+    _blocking_prob_newton(coefs_and_deriv, 1, 2, 1.0, 1, tol)
+    _n_servers_bisect(0.5, 2, 1.0, 1, tol)
+    _n_sources_bisect(0.5, 1, 1.0, 1, tol)
+    _total_traffic_bisect(coefs, 0.5, 1, 2, 1, tol)
+    _total_traffic_anderson_bjorck(coefs, 0.5, 1, 2, 1, tol)
+    _total_traffic_newton(coefs_and_deriv, 0.5, 1, 2, 1, tol)
+    _blocking_prob_bisect_batch(
+        coefs,
+        1,
+        2,
+        np.ones((1,)),
+        1,
+        tol,
+        np.empty((1,), dtype=np.int64),
+        np.empty((1,), dtype=np.int64),
+        np.empty((1,)),
+    )
+    _blocking_prob_newton_batch(
+        coefs_and_deriv,
+        1,
+        2,
+        np.ones((1,)),
+        1,
+        tol,
+        np.empty((1,), dtype=np.int64),
+        np.empty((1,), dtype=np.int64),
+        np.empty((1,)),
+    )
+
+
+if "FAST_ENGSET_WARMUP" in os.environ:
+    _warmup()
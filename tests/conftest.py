@@ -0,0 +1,11 @@
+"""conftest.py"""
+
+import pytest
+
+from fast_engset import _fast_engset
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _warmup():
+    """Compiles (or loads from Numba's cache) every routine once per session instead of inside the first test."""
+    _fast_engset._warmup()  # pylint: disable=protected-access
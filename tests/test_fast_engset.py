@@ -1,138 +1,289 @@
 """test_fast_engset.py"""
 
+import math
+import sys
 
 import numpy as np
 import pytest
 
 import fast_engset as fe
+from fast_engset import _fast_engset
 
 
-def _rand_params_list(n_params=1000, max_n_sources=100, min_blocking_prob=1e-6):
+def _rand_params_list(n_params=1000, max_n_sources=100, min_blocking_prob=1e-6, batch_size=4096, seed=0):
+    rng = np.random.default_rng(seed)
     params_list = []
-    while len(params_list) < n_params:
-        n_sources = np.random.randint(low=2, high=max_n_sources)
-        n_servers = np.random.randint(low=1, high=n_sources)
-        total_traffic = np.random.uniform(low=0.0, high=n_servers)
-        result = fe.blocking_prob(n_servers, n_sources, total_traffic)
-        blocking_prob = result.value
-        if result.status != fe.Status.OK or blocking_prob < min_blocking_prob:
-            continue
-        params = (blocking_prob, n_servers, n_sources, total_traffic)
-        params_list.append(params)
-    return params_list
+    while True:
+        # Draw candidates in batches to amortize the overhead of calling into the generator
+        n_sources = rng.integers(low=2, high=max_n_sources, size=batch_size)
+        n_servers = rng.integers(low=1, high=n_sources)
+        total_traffic = rng.uniform(low=0.0, high=n_servers)
+        for n_sources_, n_servers_, total_traffic_ in zip(
+            n_sources.tolist(), n_servers.tolist(), total_traffic.tolist()
+        ):
+            result = fe.blocking_prob(n_servers_, n_sources_, total_traffic_)
+            blocking_prob = result.value
+            if result.status != fe.Status.OK or blocking_prob < min_blocking_prob:
+                continue
+            params = (blocking_prob, n_servers_, n_sources_, total_traffic_)
+            params_list.append(params)
+            if len(params_list) == n_params:
+                return params_list
+
+
+# Iteration budgets: bisection and Newton's method converge well within 64 iterations (bisection over the bit patterns
+# of doubles takes at most 64), whereas fixed point iteration converges only linearly
+_MAX_N_ITERS = {
+    fe.Algorithm.ANDERSON_BJORCK: 64,
+    fe.Algorithm.BISECT: 64,
+    fe.Algorithm.BIT_BISECT: 64,
+    fe.Algorithm.FIXEDP: 1024,
+    fe.Algorithm.NEWTON: 64,
+}
+
+# Shared by the randomized tests below (and seeded so that failures are reproducible). Only the first few are run by
+# default; the rest are marked as stress tests (run them with ``pytest -m stress``).
+_N_QUICK_RAND_PARAMS = 50
+_RAND_PARAMS_LIST = [
+    params if i < _N_QUICK_RAND_PARAMS else pytest.param(*params, marks=pytest.mark.stress)
+    for i, params in enumerate(_rand_params_list())
+]
 
 
 @pytest.mark.parametrize(
-    "n_servers,n_sources,total_traffic",
+    "func,args",
     [
         # yapf: disable
-        (0, 1, 1.0),
-        (1, 1, 1.0),
-        (1, 2, 0.0),
+        (fe.blocking_prob, (0, 1, 1.0)),
+        (fe.blocking_prob, (1, 1, 1.0)),
+        (fe.blocking_prob, (1, 2, 0.0)),
+        (fe.blocking_prob_batch, (0, 1, [1.0])),
+        (fe.blocking_prob_batch, (1, 1, [1.0])),
+        (fe.blocking_prob_batch, (1, 2, [1.0, 0.0])),
+        (fe.n_servers, (0.0, 2, 1.0)),
+        (fe.n_servers, (1.0, 2, 1.0)),
+        (fe.n_servers, (0.5, 1, 1.0)),
+        (fe.n_servers, (0.5, 2, 0.0)),
+        (fe.n_sources, (0.0, 1, 1.0)),
+        (fe.n_sources, (1.0, 1, 1.0)),
+        (fe.n_sources, (0.5, 0, 1.0)),
+        (fe.n_sources, (0.5, 1, 0.0)),
+        (fe.total_traffic, (0.0, 1, 2)),
+        (fe.total_traffic, (1.0, 1, 2)),
+        (fe.total_traffic, (0.5, 0, 2)),
+        (fe.total_traffic, (0.5, 1, 1)),
         # yapf: enable
     ],
 )
-def test_bad_inputs_in_blocking_prob(n_servers, n_sources, total_traffic):
-    """Test bad inputs in computing the blocking probability."""
+def test_bad_inputs(func, args):
+    """Test bad inputs in each routine."""
     with pytest.raises(ValueError):
-        fe.blocking_prob(n_servers, n_sources, total_traffic)
+        func(*args)
 
 
 @pytest.mark.parametrize(
-    "blocking_prob,n_sources,total_traffic",
+    "func,args",
     [
         # yapf: disable
-        (0.0, 2, 1.0),
-        (1.0, 2, 1.0),
-        (0.5, 1, 1.0),
-        (0.5, 2, 0.0),
+        (fe.blocking_prob, (5, 20, 4.0)),
+        (fe.n_servers, (0.1, 20, 4.0)),
+        (fe.n_sources, (0.1, 5, 4.0)),
+        (fe.total_traffic, (0.1, 5, 20)),
         # yapf: enable
     ],
 )
-def test_bad_inputs_in_n_servers(blocking_prob, n_sources, total_traffic):
-    """Test bad inputs in computing the number of servers."""
-    with pytest.raises(ValueError):
-        fe.n_servers(blocking_prob, n_sources, total_traffic)
+def test_max_n_iters_reached(func, args):
+    """Test that each routine reports running out of iterations, even before its bracket is found."""
+    result = func(*args, max_n_iters=1)
+    assert result.status == fe.Status.MAX_N_ITERS_REACHED
+    assert np.isfinite(result.value)
+
+
+# Reference values from https://www.erlang.com/calculator/engset/
+_BLOCKING_PROB_REFERENCE_VALUES = [
+    # (blocking_prob, n_servers, n_sources, total_traffic)
+    # yapf: disable
+    (0.016, 5, 10, 2.0),
+    (0.181, 5, 20, 4.0),
+    (0.471, 5, 20, 8.0),
+    (0.709, 5, 20, 16.0),
+    (0.764, 5, 40, 20.0),
+    # yapf: enable
+]
+
+
+def test_blocking_prob():
+    """Test computing the blocking probability."""
+    expected = np.array([blocking_prob for blocking_prob, _, _, _ in _BLOCKING_PROB_REFERENCE_VALUES])
+    algs = (fe.Algorithm.BISECT, fe.Algorithm.BIT_BISECT, fe.Algorithm.FIXEDP, fe.Algorithm.NEWTON)
+    values = {}
+    for alg in algs:
+        results = [
+            fe.blocking_prob(n_servers, n_sources, total_traffic, alg=alg, max_n_iters=_MAX_N_ITERS[alg])
+            for _, n_servers, n_sources, total_traffic in _BLOCKING_PROB_REFERENCE_VALUES
+        ]
+        assert all(result.n_iters <= _MAX_N_ITERS[alg] for result in results), alg
+        assert all(result.status == fe.Status.OK for result in results), alg
+        values[alg] = np.array([result.value for result in results])
+
+    np.testing.assert_allclose(values[fe.Algorithm.BISECT], expected, rtol=0.0, atol=1e-3)
+    for alg in algs:
+        np.testing.assert_allclose(values[alg], values[fe.Algorithm.BISECT], rtol=1e-6, err_msg=str(alg))
 
 
 @pytest.mark.parametrize(
-    "blocking_prob,n_servers,total_traffic",
+    "n_servers,n_sources,total_traffic",
     [
         # yapf: disable
-        (0.0, 1, 1.0),
-        (1.0, 1, 1.0),
-        (0.5, 0, 1.0),
-        (0.5, 1, 0.0),
+        (20, 40, 2.0),
+        (50, 100, 1.0),
         # yapf: enable
     ],
 )
-def test_bad_inputs_in_n_sources(blocking_prob, n_servers, total_traffic):
-    """Test bad inputs in computing the number of sources."""
-    with pytest.raises(ValueError):
-        fe.n_sources(blocking_prob, n_servers, total_traffic)
+def test_tiny_blocking_prob(n_servers, n_sources, total_traffic):
+    """Test resolving tiny blocking probabilities by bisecting over bit patterns."""
+    result = fe.blocking_prob(n_servers, n_sources, total_traffic, alg=fe.Algorithm.BIT_BISECT)
+    assert result.n_iters <= 64
+    assert result.status == fe.Status.OK
+    # The blocking probability is too small to affect the hypergeometric function
+    arg = n_sources / total_traffic - 1.0
+    expected = 1.0 / fe._hyp2f1(n_servers, n_sources, arg, 0.0)  # pylint: disable=protected-access
+    assert pytest.approx(expected, rel=1e-6) == result.value
 
 
 @pytest.mark.parametrize(
-    "blocking_prob,n_servers,n_sources",
+    "n_servers,n_sources,total_traffic",
     [
         # yapf: disable
-        (0.0, 1, 2),
-        (1.0, 1, 2),
-        (0.5, 0, 2),
-        (0.5, 1, 1),
+        (271, 372, 5.92),
+        (300, 400, 1.0),
         # yapf: enable
     ],
 )
-def test_bad_inputs_in_total_traffic(blocking_prob, n_servers, n_sources):
-    """Test bad inputs in computing the total traffic."""
-    with pytest.raises(ValueError):
-        fe.total_traffic(blocking_prob, n_servers, n_sources)
+def test_overflowing_hyp2f1(n_servers, n_sources, total_traffic):
+    """Test Newton's method where the hypergeometric function overflows."""
+    result = fe.blocking_prob(n_servers, n_sources, total_traffic, max_n_iters=_MAX_N_ITERS[fe.Algorithm.NEWTON])
+    assert result.status == fe.Status.OK
+    assert result.value == 0.0
+
+    result = fe.blocking_prob_batch(n_servers, n_sources, [total_traffic])
+    assert result.status[0] == fe.Status.OK.value
+    assert result.value[0] == 0.0
+
+    # The initial guess is too small for the derivative to be representable
+    result = fe.total_traffic(0.05, n_servers, n_sources, alg=fe.Algorithm.NEWTON)
+    assert result.n_iters <= _MAX_N_ITERS[fe.Algorithm.NEWTON]
+    assert result.status == fe.Status.UNSTABLE
+
+
+@pytest.mark.skipif(
+    _fast_engset._jit_enabled,  # pylint: disable=protected-access
+    reason="Compiled kernels use a fused multiply-add instead",
+)
+def test_multiply_add_overflows():
+    """Test that multiply-adds overflow to infinity instead of raising (as ``math.fma`` does) when JIT is disabled."""
+    assert _fast_engset._fma(1e200, 1e200, 0.0) == math.inf  # pylint: disable=protected-access
+    for alg in (fe.Algorithm.BISECT, fe.Algorithm.NEWTON):
+        result = fe.blocking_prob(120, 128, 0.01, alg=alg)
+        assert result.status == fe.Status.OK
+
+
+def test_newton_safeguard():
+    """Test that Newton's method falls back to bisection when its steps are not finite."""
+    tol = pow(2, -24)
+    # pylint: disable=protected-access
+    coefs = _fast_engset._hyp2f1_coefs_and_deriv_cached(5, 10).copy()
+    coefs[1:, 1] = np.nan
+    n_iters, status, value = _fast_engset._blocking_prob_newton(coefs, 5, 10, 2.0, 64, tol)
+    # pylint: enable=protected-access
+    assert n_iters <= 64
+    assert status == fe.Status.OK.value
+    assert pytest.approx(fe.blocking_prob(5, 10, 2.0).value, abs=tol) == value
 
 
-# Reference values from https://www.erlang.com/calculator/engset/
 @pytest.mark.parametrize(
-    "blocking_prob,n_servers,n_sources,total_traffic",
+    "n_servers,n_sources,total_traffic",
     [
         # yapf: disable
-        (0.016, 5, 10, 2.0),
-        (0.181, 5, 20, 4.0),
-        (0.471, 5, 20, 8.0),
-        (0.709, 5, 20, 16.0),
-        (0.764, 5, 40, 20.0),
+        (5, 10, 2.0),
+        (5, 40, 20.0),
+        (200, 400, 190.0),
+        # Coefficients exceeding the range of single precision
+        (200, 220, 210.0),
+        (1000, 1100, 1050.0),
+        # Coefficients below the normal range of single precision
+        (500, 50000, 649.6316),
         # yapf: enable
     ],
 )
-def test_blocking_prob(blocking_prob, n_servers, n_sources, total_traffic):
-    """Test computing the blocking probability."""
-    max_n_iters = 1024
+def test_float32_coefs(n_servers, n_sources, total_traffic):
+    """Test computing with single precision coefficients."""
+    result = fe.blocking_prob(n_servers, n_sources, total_traffic)
+    result_float32 = fe.blocking_prob(n_servers, n_sources, total_traffic, use_float32_coefs=True)
+    assert result_float32.status == fe.Status.OK
+    assert pytest.approx(result.value, rel=1e-6) == result_float32.value
 
-    result_bisect = fe.blocking_prob(
-        n_servers, n_sources, total_traffic, alg=fe.Algorithm.NEWTON, max_n_iters=max_n_iters
-    )
-    result_newton = fe.blocking_prob(
-        n_servers, n_sources, total_traffic, alg=fe.Algorithm.BISECT, max_n_iters=max_n_iters
-    )
-    result_fixedp = fe.blocking_prob(
-        n_servers, n_sources, total_traffic, alg=fe.Algorithm.FIXEDP, max_n_iters=max_n_iters
-    )
+    result = fe.total_traffic(result.value, n_servers, n_sources)
+    result_float32 = fe.total_traffic(result_float32.value, n_servers, n_sources, use_float32_coefs=True)
+    assert result_float32.status == fe.Status.OK
+    assert pytest.approx(result.value, rel=1e-6) == result_float32.value
 
-    assert result_bisect.n_iters <= max_n_iters
-    assert result_fixedp.n_iters <= max_n_iters
-    assert result_newton.n_iters <= max_n_iters
 
-    assert result_bisect.status == fe.Status.OK
-    assert result_fixedp.status == fe.Status.OK
-    assert result_newton.status == fe.Status.OK
+def test_float32_coefs_by_default():
+    """Test that single precision coefficients are only used by default for large tolerances and polynomials."""
+    tol = pow(2, -16)
+    result = fe.blocking_prob(150, 160, 155.0, tol=tol)
+    assert result == fe.blocking_prob(150, 160, 155.0, tol=tol, use_float32_coefs=True)
+    assert result != fe.blocking_prob(150, 160, 155.0, tol=tol, use_float32_coefs=False)
+    result = fe.blocking_prob(150, 160, 155.0)
+    assert result == fe.blocking_prob(150, 160, 155.0, use_float32_coefs=False)
+    result = fe.blocking_prob(5, 10, 2.0, tol=tol)
+    assert result == fe.blocking_prob(5, 10, 2.0, tol=tol, use_float32_coefs=False)
+    # Coefficients exceeding the range of single precision
+    result = fe.blocking_prob(200, 220, 210.0, tol=tol)
+    assert result == fe.blocking_prob(200, 220, 210.0, tol=tol, use_float32_coefs=False)
+    result = fe.total_traffic(0.05, 1000, 1100, tol=tol)
+    assert result == fe.total_traffic(0.05, 1000, 1100, tol=tol, use_float32_coefs=False)
+    # Coefficients below the normal range of single precision
+    for tol_ in (pow(2, -20), tol):
+        result = fe.blocking_prob(500, 50000, 649.6316, tol=tol_)
+        assert result == fe.blocking_prob(500, 50000, 649.6316, tol=tol_, use_float32_coefs=False)
+    result = fe.total_traffic(0.2352, 500, 50000, tol=tol)
+    assert result == fe.total_traffic(0.2352, 500, 50000, tol=tol, use_float32_coefs=False)
+
+
+@pytest.mark.parametrize("alg", [fe.Algorithm.BISECT, fe.Algorithm.NEWTON])
+@pytest.mark.parametrize(
+    "n_servers,n_sources",
+    [
+        # yapf: disable
+        (1, 2),
+        (5, 10),
+        (5, 40),
+        (50, 200),
+        (200, 400),
+        # yapf: enable
+    ],
+)
+def test_blocking_prob_batch(n_servers, n_sources, alg):
+    """Test computing blocking probabilities in a batch."""
+    total_traffic = np.linspace(0.1, n_sources, 32)
+    tol = pow(2, -24)
+
+    result = fe.blocking_prob_batch(n_servers, n_sources, total_traffic, alg=alg, tol=tol)
 
-    assert pytest.approx(result_bisect.value, abs=1e-3) == blocking_prob
-    assert pytest.approx(result_bisect.value) == result_fixedp.value
-    assert pytest.approx(result_bisect.value) == result_newton.value
+    for i, total_traffic_ in enumerate(total_traffic):
+        expected = fe.blocking_prob(n_servers, n_sources, total_traffic_, alg=alg, tol=tol)
+        assert result.n_iters[i] == expected.n_iters
+        assert result.status[i] == expected.status.value
+        # Batched evaluations may round differently, which can alter the last step of bisection
+        assert pytest.approx(result.value[i], abs=2.0 * tol) == expected.value
 
 
-@pytest.mark.parametrize("blocking_prob,n_servers,n_sources,total_traffic", _rand_params_list())
+@pytest.mark.parametrize("blocking_prob,n_servers,n_sources,total_traffic", _RAND_PARAMS_LIST)
 def test_n_servers(blocking_prob, n_servers, n_sources, total_traffic):
     """Test computing the number of servers."""
-    max_n_iters = 1024
+    max_n_iters = _MAX_N_ITERS[fe.Algorithm.BISECT]
 
     result = fe.n_servers(blocking_prob - 1e-12, n_sources, total_traffic, max_n_iters=max_n_iters)
     assert result.n_iters <= max_n_iters
@@ -145,10 +296,10 @@ def test_n_servers(blocking_prob, n_servers, n_sources, total_traffic):
     assert result.value == n_servers
 
 
-@pytest.mark.parametrize("blocking_prob,n_servers,n_sources,total_traffic", _rand_params_list())
+@pytest.mark.parametrize("blocking_prob,n_servers,n_sources,total_traffic", _RAND_PARAMS_LIST)
 def test_n_sources(blocking_prob, n_servers, n_sources, total_traffic):
     """Test computing the number of sources."""
-    max_n_iters = 1024
+    max_n_iters = _MAX_N_ITERS[fe.Algorithm.BISECT]
 
     result = fe.n_sources(blocking_prob - 1e-12, n_servers, total_traffic, max_n_iters=max_n_iters)
     assert result.n_iters <= max_n_iters
@@ -161,12 +312,38 @@ def test_n_sources(blocking_prob, n_servers, n_sources, total_traffic):
     assert result.value == n_sources
 
 
-@pytest.mark.parametrize("blocking_prob,n_servers,n_sources,total_traffic", _rand_params_list())
+@pytest.mark.parametrize(
+    "blocking_prob,n_servers,total_traffic",
+    [
+        # yapf: disable
+        (0.5, 1, 1.0),
+        (0.001, 300, 10.0),
+        (1e-6, 192, 0.16),
+        # yapf: enable
+    ],
+)
+def test_n_sources_unbounded(blocking_prob, n_servers, total_traffic):
+    """Test blocking probabilities that are not achieved by any number of sources."""
+    result = fe.n_sources(blocking_prob, n_servers, total_traffic, max_n_iters=_MAX_N_ITERS[fe.Algorithm.BISECT])
+    assert result.n_iters <= _MAX_N_ITERS[fe.Algorithm.BISECT]
+    assert result.status == fe.Status.UNBOUNDED
+    assert result.value == sys.maxsize
+
+
+@pytest.mark.parametrize("blocking_prob,n_servers,n_sources,total_traffic", _RAND_PARAMS_LIST)
 def test_total_traffic(blocking_prob, n_servers, n_sources, total_traffic):
     """Test computing the total traffic."""
-    max_n_iters = 1024
+    max_n_iters = _MAX_N_ITERS[fe.Algorithm.BISECT]
 
     result_bisect = fe.total_traffic(blocking_prob, n_servers, n_sources, max_n_iters=max_n_iters)
     assert result_bisect.n_iters <= max_n_iters
     assert result_bisect.status == fe.Status.OK
     assert pytest.approx(result_bisect.value, abs=1e-6) == total_traffic
+
+    max_n_iters = _MAX_N_ITERS[fe.Algorithm.ANDERSON_BJORCK]
+    result_anderson_bjorck = fe.total_traffic(
+        blocking_prob, n_servers, n_sources, alg=fe.Algorithm.ANDERSON_BJORCK, max_n_iters=max_n_iters
+    )
+    assert result_anderson_bjorck.n_iters <= max_n_iters
+    assert result_anderson_bjorck.status == fe.Status.OK
+    assert pytest.approx(result_anderson_bjorck.value, abs=1e-6) == total_traffic